@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import Lead, Offer
+from django.contrib.admin.views.main import ChangeList
+from .models import Lead, Offer, ScoringJob
+
+class LeadChangeList(ChangeList):
+    def get_queryset(self, request, *args, **kwargs):
+        # The changelist only renders list_display; skip the large bio/reasoning TEXT columns
+        return super().get_queryset(request, *args, **kwargs).only(*self.model_admin.list_display)
 
 @admin.register(Lead)
 class LeadAdmin(admin.ModelAdmin):
@@ -7,6 +13,14 @@ class LeadAdmin(admin.ModelAdmin):
     list_filter = ['intent', 'industry']
     search_fields = ['name', 'company', 'role']
 
+    def get_changelist(self, request, **kwargs):
+        return LeadChangeList
+
 @admin.register(Offer)
 class OfferAdmin(admin.ModelAdmin):
     list_display = ['name', 'created_at']
+
+@admin.register(ScoringJob)
+class ScoringJobAdmin(admin.ModelAdmin):
+    list_display = ['batch_id', 'status', 'total_leads', 'total_scored', 'created_at', 'completed_at']
+    list_filter = ['status']
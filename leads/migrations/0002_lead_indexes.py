@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lead',
+            name='industry',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['-score'], name='lead_score_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['intent', 'industry'], name='lead_intent_industry_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0002_lead_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_score_desc_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('score__isnull', False)), fields=['-score'], name='lead_scored_desc_idx'),
+        ),
+    ]
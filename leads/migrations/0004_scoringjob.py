@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_lead_scored_partial_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoringJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=100, unique=True)),
+                ('status', models.CharField(max_length=20)),
+                ('total_leads', models.IntegerField()),
+                ('total_scored', models.IntegerField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(null=True)),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='leads.offer')),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0004_scoringjob'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_scored_desc_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('score__isnull', False)), fields=['-score', 'company', 'name'], name='lead_score_order'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['company', 'name', '-id'], name='lead_comp_name_id'),
+        ),
+    ]
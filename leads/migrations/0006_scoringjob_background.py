@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0005_lead_dedup_and_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='scoringjob',
+            name='batch_id',
+            field=models.CharField(max_length=100, null=True, unique=True),
+        ),
+    ]
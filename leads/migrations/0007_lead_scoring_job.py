@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0006_scoringjob_background'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='scoring_job',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='leads', to='leads.scoringjob'),
+        ),
+    ]
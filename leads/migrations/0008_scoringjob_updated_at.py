@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0007_lead_scoring_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scoringjob',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 
 class Offer(models.Model):
     name = models.CharField(max_length=200)
@@ -10,7 +11,7 @@ class Lead(models.Model):
     name = models.CharField(max_length=200)
     role = models.CharField(max_length=200)
     company = models.CharField(max_length=200)
-    industry = models.CharField(max_length=200)
+    industry = models.CharField(max_length=200, db_index=True)
     location = models.CharField(max_length=200)
     linkedin_bio = models.TextField(blank=True)
     intent = models.CharField(max_length=20, choices=[
@@ -21,3 +22,40 @@ class Lead(models.Model):
     score = models.IntegerField(null=True)
     reasoning = models.TextField(null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Job currently (or last) holding this lead for scoring; while the job is
+    # not final, other scoring runs skip the lead
+    scoring_job = models.ForeignKey(
+        'ScoringJob', null=True, blank=True, on_delete=models.SET_NULL, related_name='leads'
+    )
+
+    class Meta:
+        indexes = [
+            # Results endpoint ranks scored leads by (-score, company, name);
+            # unscored rows are left out of the index
+            models.Index(
+                fields=['-score', 'company', 'name'],
+                condition=Q(score__isnull=False),
+                name='lead_score_order'
+            ),
+            # Latest-record-per-company/name lookup in _get_unique_leads
+            models.Index(fields=['company', 'name', '-id'], name='lead_comp_name_id'),
+            # Admin list_filter on intent and industry
+            models.Index(fields=['intent', 'industry'], name='lead_intent_industry_idx'),
+        ]
+
+class ScoringJob(models.Model):
+    """
+    Asynchronous scoring run: either submitted to the OpenAI Batch API
+    (batch_id set) or running in a background thread (batch_id null).
+    """
+    offer = models.ForeignKey(Offer, on_delete=models.CASCADE)
+    batch_id = models.CharField(max_length=100, unique=True, null=True)
+    # OpenAI batch status (validating, in_progress, completed, failed, ...);
+    # 'submitting' while the batch is being uploaded
+    status = models.CharField(max_length=20)
+    total_leads = models.IntegerField()
+    total_scored = models.IntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Heartbeat: background jobs touch this after every AI request they finish
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True)
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from typing import Dict, List
+
+# Rough size of one token in characters for English prompts
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(messages: List[Dict], max_tokens: int) -> int:
+    """
+    Estimate the tokens a chat completion will consume against the TPM limit.
+
+    OpenAI counts the prompt plus the requested completion budget, so the
+    estimate is prompt characters / CHARS_PER_TOKEN plus max_tokens.
+
+    Args:
+        messages (List[Dict]): Chat messages with 'content' strings
+        max_tokens (int): Completion budget passed to the API
+
+    Returns:
+        int: Estimated token cost of the request
+    """
+    prompt_chars = sum(len(message['content']) for message in messages)
+    return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+class RateLimiter:
+    """
+    Client-side pacing for OpenAI requests and tokens per minute.
+
+    Keeps running request and token capacities that refill continuously at
+    the configured per-minute rates. acquire() waits until both capacities
+    cover the next call and then debits them, so concurrent callers settle
+    at the account's steady-state throughput instead of triggering 429s.
+
+    asyncio primitives are bound to an event loop, so create one limiter per
+    batch inside the coroutine that runs it.
+    """
+
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        # Start full, like a fresh minute on the API side
+        self.available_request_capacity = float(max_requests_per_minute)
+        self.available_token_capacity = float(max_tokens_per_minute)
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the capacity earned since the last update, capped at one minute's worth."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self.available_request_capacity = min(
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60,
+            self.max_requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60,
+            self.max_tokens_per_minute
+        )
+
+    async def acquire(self, tokens: int):
+        """
+        Wait until one request of `tokens` tokens fits both limits, then debit it.
+
+        Callers are served one at a time, so capacity is never handed out twice.
+        """
+        # A single request larger than the whole minute budget could never fit
+        tokens = min(tokens, self.max_tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                # Sleep just long enough for the scarcer capacity to refill
+                request_wait = (1 - self.available_request_capacity) * 60 / self.max_requests_per_minute
+                token_wait = (tokens - self.available_token_capacity) * 60 / self.max_tokens_per_minute
+                await asyncio.sleep(max(request_wait, token_wait, 0))
@@ -4,9 +4,22 @@ from .models import Offer, Lead
 class OfferSerializer(serializers.ModelSerializer):
     class Meta:
         model = Offer
-        fields = '__all__'
+        fields = ('id', 'name', 'value_props', 'ideal_use_cases', 'created_at')
 
 class LeadSerializer(serializers.ModelSerializer):
+    """Full lead representation used for upload, retrieve and update."""
     class Meta:
         model = Lead
-        fields = '__all__'
+        fields = (
+            'id', 'name', 'role', 'company', 'industry', 'location',
+            'linkedin_bio', 'intent', 'score', 'reasoning', 'created_at'
+        )
+
+class LeadListSerializer(serializers.ModelSerializer):
+    """
+    Compact lead representation for list and results endpoints.
+    Leaves out the profile-only columns (location, linkedin_bio, created_at).
+    """
+    class Meta:
+        model = Lead
+        fields = ('id', 'name', 'role', 'company', 'industry', 'intent', 'score', 'reasoning')
@@ -1,8 +1,27 @@
-from django.test import TestCase
+import asyncio
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import QuerySet
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
-from .models import Lead, Offer
-from .utils import calculate_rule_score
+from rest_framework.renderers import JSONRenderer
+from asgiref.sync import async_to_sync
+from .models import Lead, Offer, ScoringJob
+from .ratelimit import RateLimiter
+from .renderers import ORJSONRenderer
+from .views import LeadViewSet, _ai_cache_key, _format_offer_block, _parse_ai_intents, _parse_batch_output
+from .utils import (
+    REQUIRED_FIELDS, LeadVO, calculate_rule_score, flags_to_reasons, flags_to_score,
+    prepare_offer, score_leads_bulk
+)
 
 class LeadScoringTests(APITestCase):
     """
@@ -51,6 +70,135 @@ class LeadScoringTests(APITestCase):
         self.assertIn('total_scored', response.data)
         self.assertIn('scoring_method', response.data)
 
+    def test_scoring_persists_results(self):
+        """
+        Test that scoring writes score, intent and reasoning back to the lead.
+        """
+        response = self.client.post('/api/leads/score/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        self.lead.refresh_from_db()
+        self.assertIsNotNone(self.lead.score)
+        self.assertIn(self.lead.intent, ['High', 'Medium', 'Low'])
+        self.assertIn('Decision maker role (+20)', self.lead.reasoning)
+        self.assertEqual(self.lead.name, 'Test User')
+
+    def test_scoring_query_count(self):
+        """
+        Test that scoring writes leads back in bulk.
+        Query count must not grow with the number of leads scored.
+        """
+        for i in range(5):
+            Lead.objects.create(
+                name=f"Lead {i}", role="Manager", company=f"Company {i}",
+                industry="B2B SaaS", location="NY", linkedin_bio="Bio"
+            )
+        
+        # offer + leads + (savepoint, UPDATE, release) for the bulk write
+        with self.assertNumQueries(5):
+            response = self.client.post('/api/leads/score/')
+        self.assertEqual(response.data['total_scored'], 6)
+        self.assertFalse(Lead.objects.filter(score__isnull=True).exists())
+
+    @override_settings(OPENAI_API_KEY='sk-test')
+    def test_scoring_reuses_cached_ai_result(self):
+        """
+        Test that a lead whose prompt was already classified is scored from
+        the cache instead of calling OpenAI again.
+        """
+        key = _ai_cache_key(_format_offer_block(self.offer), self.lead)
+        cache.set(key, (50, "High", "Cached classification."))
+        self.addCleanup(cache.delete, key)
+        
+        response = self.client.post('/api/leads/score/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.data['results'][0]
+        self.assertEqual(result['score_breakdown'], {'rule_score': 50, 'ai_score': 50})
+        self.assertIn("Cached classification.", result['reasoning'])
+
+    @override_settings(OPENAI_API_KEY='sk-test')
+    def test_scoring_with_mocked_openai(self):
+        """
+        Test the concurrent AI path end to end: replies are matched to their
+        own leads whatever order requests finish in, a failed request only
+        affects its own leads, a rate limit falls back to rule-only scoring,
+        and only real classifications are cached.
+        """
+        from openai import RateLimitError
+        
+        for name in ("Slow Fit", "Broken Reply", "Limited Lead", "Garbled Reply"):
+            Lead.objects.create(
+                name=name, role="Manager", company=f"{name} Co", industry="B2B SaaS",
+                location="Test Location", linkedin_bio="Test Bio"
+            )
+        self.addCleanup(cache.clear)
+        
+        def reply(content):
+            return mock.Mock(choices=[mock.Mock(message=mock.Mock(content=content))])
+        
+        async def create(**request):
+            prompt = request['messages'][1]['content']
+            if "Slow Fit" in prompt:
+                # Finishes last, so replies are not in request order
+                await asyncio.sleep(0.05)
+                return reply('{"results": [{"i": 0, "intent": "High", "reason": "Slow but great fit."}]}')
+            if "Broken Reply" in prompt:
+                raise RuntimeError("boom")
+            if "Limited Lead" in prompt:
+                raise RateLimitError("slow down", response=mock.Mock(status_code=429, headers={}), body=None)
+            if "Garbled Reply" in prompt:
+                return reply('not json')
+            return reply('{"results": [{"i": 0, "intent": "Medium", "reason": "Decent fit."}]}')
+        
+        client = mock.MagicMock()
+        client.__aenter__.return_value = client
+        client.chat.completions.create = mock.AsyncMock(side_effect=create)
+        
+        # One lead per request, so every lead gets its own reply
+        with mock.patch('leads.views.AI_BATCH_SIZE', 1), \
+                mock.patch('openai.AsyncOpenAI', return_value=client):
+            response = self.client.post('/api/leads/score/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(client.chat.completions.create.await_count, 5)
+        results = {result['name']: result for result in response.data['results']}
+        
+        self.assertEqual(results["Test User"]['score_breakdown'], {'rule_score': 50, 'ai_score': 30})
+        self.assertIn("[AI: Decent fit.]", results["Test User"]['reasoning'])
+        self.assertEqual(results["Slow Fit"]['score_breakdown'], {'rule_score': 40, 'ai_score': 50})
+        self.assertIn("[AI: Slow but great fit.]", results["Slow Fit"]['reasoning'])
+        self.assertIn("[AI: AI scoring error: boom]", results["Broken Reply"]['reasoning'])
+        self.assertIn("[AI: AI response format error]", results["Garbled Reply"]['reasoning'])
+        # Rate limited: rule score (40) scaled to the 0-100 range
+        self.assertEqual(results["Limited Lead"]['score'], 80)
+        self.assertTrue(results["Limited Lead"]['reasoning'].startswith("[Rule-based only - AI rate limited]"))
+        
+        offer_block = _format_offer_block(self.offer)
+        cached = {
+            lead.name: cache.get(_ai_cache_key(offer_block, lead)) for lead in Lead.objects.all()
+        }
+        self.assertEqual(cached, {
+            "Test User": (30, "Medium", "Decent fit."),
+            "Slow Fit": (50, "High", "Slow but great fit."),
+            "Broken Reply": None,
+            "Limited Lead": None,
+            "Garbled Reply": None,
+        })
+
+    def test_ai_prompt_embeds_offer_block_unindented(self):
+        """
+        Test that every line of the offer block reaches the prompt flush left,
+        independent of how the prompt template is indented in the source.
+        """
+        offer_block = _format_offer_block(self.offer)
+        messages = LeadViewSet()._build_ai_messages([self.lead], offer_block)
+        content = messages[1]['content']
+        
+        self.assertIn("\n" + offer_block + "\n", content)
+        self.assertIn("\n- Value Propositions: test1, test2\n", content)
+        self.assertTrue(content.startswith("Analyze each lead's buying intent"))
+
     def test_scoring_without_offer(self):
         """
         Test scoring fails gracefully when no offer exists.
@@ -71,6 +219,66 @@ class LeadScoringTests(APITestCase):
         self.assertIn('results', response.data)
         self.assertIn('count', response.data)
 
+    def test_results_keep_latest_duplicate(self):
+        """
+        Test that results list each company/name pair once, using the most
+        recently uploaded record.
+        """
+        for score in (40, 80):
+            Lead.objects.create(
+                name="Dup User", role="CEO", company="Dup Co", industry="B2B SaaS",
+                location="NY", linkedin_bio="Bio", intent="Medium", score=score
+            )
+        
+        response = self.client.get('/api/leads/results/')
+        duplicates = [lead for lead in response.data['results'] if lead['name'] == "Dup User"]
+        self.assertEqual([lead['score'] for lead in duplicates], [80])
+
+    def test_results_query_count(self):
+        """
+        Test results endpoint cost does not grow with page size.
+        One COUNT query for pagination plus one query for the page itself.
+        """
+        for i in range(5):
+            Lead.objects.create(
+                name=f"Scored {i}", role="CEO", company="Test Co", industry="B2B SaaS",
+                location="NY", linkedin_bio="Bio", intent="High", score=90, reasoning="Test"
+            )
+        
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/leads/results/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+
+    def test_results_use_compact_fields(self):
+        """
+        Test results endpoint returns the compact lead representation.
+        Reasoning is kept; profile-only fields are left to the detail endpoint.
+        """
+        lead = Lead.objects.create(
+            name="Scored", role="CEO", company="Test Co", industry="B2B SaaS",
+            location="NY", linkedin_bio="Bio", intent="High", score=90, reasoning="Test"
+        )
+        
+        response = self.client.get('/api/leads/results/')
+        item = response.data['results'][0]
+        self.assertEqual(item['reasoning'], 'Test')
+        self.assertNotIn('linkedin_bio', item)
+        
+        detail = self.client.get(f'/api/leads/{lead.id}/')
+        self.assertEqual(detail.data['linkedin_bio'], 'Bio')
+
+    def test_collection_queries_skip_bio(self):
+        """
+        Test that the list and results endpoints do not load linkedin_bio.
+        """
+        for url in ('/api/leads/', '/api/leads/results/'):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+            self.assertFalse(
+                any('linkedin_bio' in query['sql'] for query in queries.captured_queries), url
+            )
+
     def test_decision_maker_scoring(self):
         """
         Test rule-based scoring for decision maker roles.
@@ -134,6 +342,27 @@ class LeadScoringTests(APITestCase):
         score, reasons = calculate_rule_score(lead, offer)
         self.assertEqual(score, 30)  # 10 (role) + 20 (industry) + 0 (incomplete)
 
+    def test_blank_field_not_complete(self):
+        """
+        Test that whitespace-only values do not count towards completeness.
+        """
+        lead = {
+            'role': 'Manager',
+            'industry': 'B2B SaaS',
+            'name': 'Test User',
+            'company': 'Test Co',
+            'location': '   ',
+            'linkedin_bio': 'Test bio'
+        }
+        offer = {
+            'ideal_use_cases': ['B2B SaaS'],
+            'value_props': ['Test']
+        }
+        
+        score, reasons = calculate_rule_score(lead, offer)
+        self.assertEqual(score, 30)  # 10 (role) + 20 (industry) + 0 (blank location)
+        self.assertNotIn('Complete profile (+10)', reasons)
+
     def test_no_match_scoring(self):
         """
         Test rule-based scoring when lead doesn't match ICP.
@@ -199,6 +428,390 @@ class LeadScoringTests(APITestCase):
             score, reasons = calculate_rule_score(lead, offer)
             self.assertGreaterEqual(score, 20, f"Role '{role}' should get decision maker points")
 
+    def test_prepared_offer_scoring(self):
+        """
+        Test that a prepare_offer() result scores the same as the raw offer.
+        ICP matching stays case-insensitive after precomputation.
+        """
+        lead = {
+            'role': 'CEO',
+            'industry': 'b2b saas',
+            'name': 'Test User',
+            'company': 'Test Co',
+            'location': 'NY',
+            'linkedin_bio': 'Test bio'
+        }
+        offer = {
+            'ideal_use_cases': ['B2B SaaS', 'Fintech'],
+            'value_props': ['Test']
+        }
+        
+        self.assertEqual(
+            calculate_rule_score(lead, prepare_offer(offer)),
+            calculate_rule_score(lead, offer)
+        )
+        self.assertEqual(calculate_rule_score(lead, prepare_offer(offer))[0], 50)
+
+    def test_bulk_scoring_matches_single(self):
+        """
+        Test that batch rule scoring returns the same results as per-lead scoring,
+        in input order.
+        """
+        leads = [
+            {'role': 'CEO', 'industry': 'B2B SaaS', 'name': 'A', 'company': 'A Co',
+             'location': 'NY', 'linkedin_bio': 'Bio'},
+            {'role': 'Manager', 'industry': 'Healthcare'},
+            {'role': 'Analyst', 'industry': 'B2B SaaS startup', 'name': 'C', 'company': 'C Co',
+             'location': 'SF', 'linkedin_bio': 'Bio'},
+        ]
+        offer = {
+            'ideal_use_cases': ['B2B SaaS'],
+            'value_props': ['Test']
+        }
+        
+        flags = score_leads_bulk([LeadVO.from_dict(lead) for lead in leads], offer)
+        self.assertEqual(
+            [(flags_to_score(f), flags_to_reasons(f)) for f in flags],
+            [calculate_rule_score(lead, offer) for lead in leads]
+        )
+
+    def test_bulk_scoring_repeated_leads(self):
+        """
+        Test that leads sharing role and industry but differing in completeness
+        are not conflated when batch scoring reuses results.
+        """
+        complete = {'role': 'CEO', 'industry': 'B2B SaaS', 'name': 'A', 'company': 'A Co',
+                    'location': 'NY', 'linkedin_bio': 'Bio'}
+        incomplete = {'role': 'CEO', 'industry': 'B2B SaaS', 'name': 'B'}
+        offer = {
+            'ideal_use_cases': ['B2B SaaS'],
+            'value_props': ['Test']
+        }
+        
+        leads = [LeadVO.from_dict(lead) for lead in (complete, incomplete, complete)]
+        scores = [flags_to_score(f) for f in score_leads_bulk(leads, offer)]
+        self.assertEqual(scores, [50, 40, 50])
+
+    def test_decision_maker_outranks_influencer(self):
+        """
+        Test that a role containing both keyword kinds scores as a decision maker,
+        regardless of which keyword comes first.
+        """
+        offer = {
+            'ideal_use_cases': ['Tech'],
+            'value_props': ['Test']
+        }
+        
+        for role in ['Senior VP', 'VP, Senior', 'Lead Director', 'Team Lead']:
+            score, reasons = calculate_rule_score({'role': role, 'industry': 'Retail'}, offer)
+            expected = "Influencer role (+10)" if role == 'Team Lead' else "Decision maker role (+20)"
+            self.assertEqual(reasons[0], expected, f"Role '{role}'")
+
+    def test_rate_limiter_debits_capacity(self):
+        """
+        Test that acquiring from the rate limiter debits one request and the
+        requested tokens without waiting while capacity is available.
+        """
+        async def acquire_twice():
+            limiter = RateLimiter(max_requests_per_minute=60, max_tokens_per_minute=1000)
+            await limiter.acquire(300)
+            await limiter.acquire(200)
+            return limiter
+        
+        limiter = async_to_sync(acquire_twice)()
+        self.assertAlmostEqual(limiter.available_request_capacity, 58, places=0)
+        self.assertAlmostEqual(limiter.available_token_capacity, 500, delta=5)
+
+    def test_parse_batched_ai_reply(self):
+        """
+        Test that a batched AI reply is mapped back to leads by index, and that
+        leads missing from the reply get the low default.
+        """
+        content = '{"results": [{"i": 2, "intent": "High", "reason": "Great fit."}, {"i": 0, "intent": "Medium", "reason": "Maybe."}]}'
+        
+        self.assertEqual(_parse_ai_intents(content, 3), [
+            (30, "Medium", "Maybe."),
+            (10, "Low", "AI response format error"),
+            (50, "High", "Great fit."),
+        ])
+        for malformed in ('not json', '{"results": null}', '{"results": 5}'):
+            self.assertEqual(_parse_ai_intents(malformed, 1), [(10, "Low", "AI response format error")])
+
+    def test_background_scoring_returns_job(self):
+        """
+        Test that background scoring answers 202 with a job that score_status
+        reports, without waiting for the scoring thread.
+        """
+        with mock.patch('leads.views.threading.Thread') as thread:
+            response = self.client.post('/api/leads/score/?background=true')
+        
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        thread.return_value.start.assert_called_once()
+        
+        job_status = self.client.get(f"/api/leads/score_status/{response.data['job_id']}/")
+        self.assertEqual(job_status.data['status'], 'in_progress')
+        self.assertEqual(job_status.data['total_leads'], 1)
+        self.assertIsNone(job_status.data['batch_id'])
+
+    @override_settings(OPENAI_API_KEY='')
+    def test_background_job_holds_its_leads(self):
+        """
+        Test that leads claimed by a running background job are skipped by
+        other scoring requests, and released once the job is stale.
+        """
+        with mock.patch('leads.views.threading.Thread'):
+            response = self.client.post('/api/leads/score/?background=true')
+            again = self.client.post('/api/leads/score/?background=true')
+            live = self.client.post('/api/leads/score/')
+        
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertNotIn('job_id', again.data)
+        self.assertNotIn('results', live.data)
+        self.assertEqual(ScoringJob.objects.count(), 1)
+        
+        # A job whose worker was restarted stops sending heartbeats
+        ScoringJob.objects.update(updated_at=timezone.now() - timedelta(days=1))
+        job_status = self.client.get(f"/api/leads/score_status/{response.data['job_id']}/")
+        self.assertEqual(job_status.data['status'], 'failed')
+        self.assertIsNotNone(job_status.data['completed_at'])
+        self.assertEqual(self.client.post('/api/leads/score/').data['total_scored'], 1)
+
+    @override_settings(OPENAI_API_KEY='')
+    def test_long_running_job_keeps_its_leads(self):
+        """
+        Test that a job older than the timeout but with a recent heartbeat is
+        still treated as running, so its leads are not scored a second time.
+        """
+        with mock.patch('leads.views.threading.Thread'):
+            response = self.client.post('/api/leads/score/?background=true')
+        ScoringJob.objects.update(created_at=timezone.now() - timedelta(days=1))
+        
+        job_status = self.client.get(f"/api/leads/score_status/{response.data['job_id']}/")
+        live = self.client.post('/api/leads/score/')
+        
+        self.assertEqual(job_status.data['status'], 'in_progress')
+        self.assertNotIn('results', live.data)
+
+    def test_stale_job_stays_failed(self):
+        """
+        Test that a thread finishing after its job was marked failed as stale
+        does not overwrite that status.
+        """
+        job = self._run_background_job(status='failed')
+        
+        self.assertEqual(job.status, 'failed')
+        self.assertIsNone(job.total_scored)
+
+    @override_settings(OPENAI_API_KEY='sk-test')
+    def test_background_job_heartbeat(self):
+        """Test that a background job touches its heartbeat after every AI request."""
+        Lead.objects.create(
+            name="Second User", role="CEO", company="Second Co", industry="B2B SaaS",
+            location="Test Location", linkedin_bio="Test Bio"
+        )
+        self.addCleanup(cache.clear)
+        
+        client = mock.MagicMock()
+        client.__aenter__.return_value = client
+        client.chat.completions.create = mock.AsyncMock(return_value=mock.Mock(choices=[mock.Mock(
+            message=mock.Mock(content='{"results": [{"i": 0, "intent": "High", "reason": "Fit."}]}')
+        )]))
+        heartbeats = []
+        aupdate = QuerySet.aupdate
+        
+        async def record(queryset, **kwargs):
+            heartbeats.append(kwargs)
+            return await aupdate(queryset, **kwargs)
+        
+        with mock.patch('leads.views.AI_BATCH_SIZE', 1), \
+                mock.patch('openai.AsyncOpenAI', return_value=client), \
+                mock.patch.object(QuerySet, 'aupdate', autospec=True, side_effect=record):
+            job = self._run_background_job(total_leads=2)
+        
+        self.assertEqual(len(heartbeats), 2)
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.total_scored, 2)
+
+    def _run_background_job(self, status='in_progress', total_leads=1):
+        """Run a background scoring job's thread body synchronously and return the job."""
+        job = ScoringJob.objects.create(offer=self.offer, status=status, total_leads=total_leads)
+        leads = list(Lead.objects.only('id', *REQUIRED_FIELDS))
+        # The thread body closes its own connection, which would end the test transaction
+        with mock.patch('leads.views.connection'):
+            LeadViewSet()._run_scoring_job(job, leads)
+        job.refresh_from_db()
+        return job
+
+    @override_settings(OPENAI_API_KEY='')
+    def test_background_job_completes(self):
+        """
+        Test that the background thread body scores the leads (rule layer only
+        without an API key) and records the outcome on the job.
+        """
+        job = self._run_background_job()
+        
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.total_scored, 1)
+        self.assertIsNotNone(job.completed_at)
+        self.lead.refresh_from_db()
+        self.assertIsNotNone(self.lead.score)
+
+    def test_background_job_failure(self):
+        """Test that an error in the background thread marks the job failed."""
+        with mock.patch.object(LeadViewSet, '_run_scoring', side_effect=RuntimeError('boom')), \
+                self.assertLogs('leads.views', 'ERROR'):
+            job = self._run_background_job()
+        
+        self.assertEqual(job.status, 'failed')
+        self.assertIsNone(job.total_scored)
+        self.assertIsNotNone(job.completed_at)
+        self.lead.refresh_from_db()
+        self.assertIsNone(self.lead.score)
+
+    def test_parse_batch_output(self):
+        """
+        Test that Batch API output lines are mapped to lead ids from custom_id,
+        and that failed requests leave their leads out.
+        """
+        ok = {
+            'custom_id': '7,9',
+            'response': {'status_code': 200, 'body': {'choices': [{'message': {
+                'content': '{"results": [{"i": 0, "intent": "High", "reason": "Fit."}, {"i": 1, "intent": "Low", "reason": "No fit."}]}'
+            }}]}}
+        }
+        failed = {'custom_id': '11', 'response': {'status_code': 500, 'body': {}}}
+        output = '\n'.join(json.dumps(record) for record in (ok, failed))
+        
+        self.assertEqual(_parse_batch_output(output), {
+            7: (50, "High", "Fit."),
+            9: (10, "Low", "No fit."),
+        })
+
+    def test_score_status_unknown_job(self):
+        """
+        Test that polling a missing batch scoring job returns 404.
+        """
+        response = self.client.get('/api/leads/score_status/999/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_score_status_finished_job(self):
+        """
+        Test that a finished batch scoring job is reported without contacting OpenAI.
+        """
+        job = ScoringJob.objects.create(
+            offer=self.offer, batch_id='batch_test', status='completed',
+            total_leads=1, total_scored=1
+        )
+        response = self.client.get(f'/api/leads/score_status/{job.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['total_scored'], 1)
+
+    @override_settings(OPENAI_API_KEY='sk-test')
+    def test_score_batch_submits_each_lead_once(self):
+        """
+        Test that leads submitted in a pending batch are skipped by a second
+        score_batch call and by live scoring, and released once the batch fails.
+        """
+        submitted = []
+        
+        def create_file(file, purpose):
+            submitted.extend(json.loads(line)['custom_id'] for line in file[1].decode().splitlines())
+            return mock.Mock(id='file_test')
+        
+        client = mock.Mock()
+        client.files.create.side_effect = create_file
+        client.batches.create.return_value = mock.Mock(id='batch_test', status='validating')
+        
+        with mock.patch('leads.views.get_openai_client', return_value=client):
+            first = self.client.post('/api/leads/score_batch/')
+            second = self.client.post('/api/leads/score_batch/')
+            live = self.client.post('/api/leads/score/')
+        
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotIn('job_id', second.data)
+        self.assertNotIn('results', live.data)
+        self.assertEqual(submitted, [str(self.lead.id)])
+        self.assertEqual(client.batches.create.call_count, 1)
+        
+        # A final status releases the lead for the next run
+        ScoringJob.objects.filter(id=first.data['job_id']).update(status='failed')
+        with self.settings(OPENAI_API_KEY=''):
+            rescored = self.client.post('/api/leads/score/')
+        self.assertEqual(rescored.data['total_scored'], 1)
+
+    def test_score_status_applies_completed_batch(self):
+        """
+        Test that polling a completed batch downloads its output and saves the
+        hybrid scores, leaving leads scored by another run in the meantime alone.
+        """
+        other = Lead.objects.create(
+            name="Other User", role="Manager", company="Other Co", industry="Healthcare",
+            location="Test Location", linkedin_bio="Test Bio"
+        )
+        rescored = Lead.objects.create(
+            name="Rescored User", role="CEO", company="Rescored Co", industry="B2B SaaS",
+            location="Test Location", linkedin_bio="Test Bio"
+        )
+        job = ScoringJob.objects.create(
+            offer=self.offer, batch_id='batch_test', status='in_progress', total_leads=3
+        )
+        Lead.objects.update(scoring_job=job)
+        # Scored live after the batch was submitted
+        Lead.objects.filter(id=rescored.id).update(score=77, intent='High', reasoning='Live run.')
+        
+        output = json.dumps({
+            'custom_id': f'{self.lead.id},{other.id},{rescored.id}',
+            'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': json.dumps({'results': [
+                {'i': 0, 'intent': 'High', 'reason': 'Great fit.'},
+                {'i': 1, 'intent': 'Low', 'reason': 'Wrong industry.'},
+                {'i': 2, 'intent': 'Low', 'reason': 'Stale answer.'},
+            ]})}}]}}
+        })
+        client = mock.Mock()
+        client.batches.retrieve.return_value = mock.Mock(status='completed', output_file_id='file_out')
+        client.files.content.return_value = mock.Mock(text=output)
+        
+        with mock.patch('leads.views.get_openai_client', return_value=client):
+            response = self.client.get(f'/api/leads/score_status/{job.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['total_scored'], 2)
+        self.assertIsNotNone(response.data['completed_at'])
+        client.files.content.assert_called_once_with('file_out')
+        
+        self.lead.refresh_from_db()
+        self.assertEqual((self.lead.score, self.lead.intent), (100, 'High'))
+        self.assertIn("[AI: Great fit.]", self.lead.reasoning)
+        other.refresh_from_db()
+        # Influencer (+10), no ICP match, complete profile (+10), Low (+10)
+        self.assertEqual((other.score, other.intent), (30, 'Low'))
+        self.assertIn("[AI: Wrong industry.]", other.reasoning)
+        rescored.refresh_from_db()
+        self.assertEqual((rescored.score, rescored.reasoning), (77, 'Live run.'))
+
+    def test_start_job_claims_in_constant_queries(self):
+        """
+        Test that creating a job and claiming its leads takes the same queries
+        however many leads there are, with no per-lead ids bound.
+        """
+        Lead.objects.bulk_create([
+            Lead(name=f"Lead {i}", role="CEO", company=f"Co {i}", industry="B2B SaaS",
+                 location="Test Location", linkedin_bio="Test Bio")
+            for i in range(50)
+        ])
+        
+        # Savepoint, job insert, claim, load, total_leads update, release
+        with self.assertNumQueries(6):
+            job, leads = LeadViewSet()._start_job(self.offer, 'in_progress')
+        
+        self.assertEqual(job.total_leads, 51)
+        self.assertEqual(len(leads), 51)
+        self.assertEqual(LeadViewSet()._start_job(self.offer, 'in_progress'), (None, []))
+        self.assertEqual(ScoringJob.objects.count(), 1)
+
     def test_csv_upload_endpoint(self):
         """
         Test CSV upload functionality.
@@ -210,6 +823,27 @@ class LeadScoringTests(APITestCase):
         # Should return 400 because no file provided
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_csv_upload_creates_leads(self):
+        """
+        Test that uploading a CSV creates one lead per row in a single batch
+        and returns them with their ids.
+        """
+        content = (
+            "name,role,company,industry,location,linkedin_bio\n"
+            "Ava Patel,Head of Growth,FlowMetrics,B2B SaaS,Pune,Scaling demand gen\n"
+            "Liam Chen,Engineer,Byteworks,Retail,Austin,\n"
+        )
+        upload = SimpleUploadedFile('leads.csv', content.encode('utf-8'), content_type='text/csv')
+        
+        # SAVEPOINT, one multi-row INSERT, RELEASE
+        with self.assertNumQueries(3):
+            response = self.client.post('/api/leads/upload/', {'file': upload}, format='multipart')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([lead['name'] for lead in response.data], ['Ava Patel', 'Liam Chen'])
+        self.assertTrue(all(lead['id'] for lead in response.data))
+        self.assertEqual(Lead.objects.count(), 3)
+
     def test_export_csv_endpoint(self):
         """
         Test CSV export endpoint returns proper response.
@@ -218,6 +852,40 @@ class LeadScoringTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response['Content-Type'], 'text/csv')
 
+    def test_export_csv_content(self):
+        """
+        Test CSV export streams a header plus scored leads, highest score first.
+        Unscored leads are excluded.
+        """
+        Lead.objects.create(
+            name="Low Lead", role="Analyst", company="A Co", industry="Retail",
+            location="NY", linkedin_bio="Bio", intent="Low", score=20, reasoning="Low fit"
+        )
+        Lead.objects.create(
+            name="High Lead", role="CEO", company="B Co", industry="B2B SaaS",
+            location="SF", linkedin_bio="Bio", intent="High", score=90, reasoning="Great fit"
+        )
+        
+        response = self.client.get('/api/leads/export_csv/')
+        content = b''.join(response.streaming_content).decode()
+        lines = content.splitlines()
+        self.assertEqual(lines[0], 'Name,Role,Company,Industry,Location,Intent,Score,Reasoning')
+        self.assertEqual(lines[1], 'High Lead,CEO,B Co,B2B SaaS,SF,High,90,Great fit')
+        self.assertEqual(lines[2], 'Low Lead,Analyst,A Co,Retail,NY,Low,20,Low fit')
+        self.assertEqual(len(lines), 3)
+
+    def test_orjson_renderer_matches_json_renderer(self):
+        """
+        Test that the orjson renderer produces the same JSON as DRF's renderer,
+        including datetimes and values it hands back to DRF's encoder.
+        """
+        data = {'lead': self.lead.name, 'created_at': self.lead.created_at, 'ratio': Decimal('0.5')}
+        
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data)),
+            json.loads(JSONRenderer().render(data))
+        )
+
     def test_lead_model_fields(self):
         """
         Test that Lead model has all required fields.
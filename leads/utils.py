@@ -1,4 +1,118 @@
-from typing import Dict, List, Tuple
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Decision makers have budget authority and can make final purchase decisions
+# These roles typically control B2B buying decisions
+DECISION_MAKER_KEYWORDS = ('ceo', 'cto', 'cfo', 'vp', 'head', 'director', 'founder', 'owner', 'president')
+
+# Influencers can advocate for the product but usually need approval
+# They're important in the buying process but not final decision makers
+INFLUENCER_KEYWORDS = ('manager', 'lead', 'architect', 'senior', 'principal')
+
+# Both keyword sets compiled into one tagged pattern so a role is classified in
+# a single left-to-right scan. The lookahead is zero-width, so keywords that
+# overlap are all seen, and decision makers win ties at the same position.
+# re.I replaces the .lower() call.
+_ROLE_RE = re.compile(
+    '(?=(?P<decision_maker>{})|(?P<influencer>{}))'.format(
+        '|'.join(DECISION_MAKER_KEYWORDS), '|'.join(INFLUENCER_KEYWORDS)
+    ),
+    re.I
+)
+
+# Lead fields read by the rule layer; all of them must be filled for completeness points
+REQUIRED_FIELDS = ('name', 'role', 'company', 'industry', 'location', 'linkedin_bio')
+_required_values = attrgetter(*REQUIRED_FIELDS)
+
+# Rule outcomes are recorded as bit flags; reason strings and points are only
+# materialized from them when a result is presented (see flags_to_reasons).
+DECISION_MAKER_ROLE = 1 << 0
+INFLUENCER_ROLE = 1 << 1
+EXACT_ICP_MATCH = 1 << 2
+ADJACENT_INDUSTRY = 1 << 3
+COMPLETE_PROFILE = 1 << 4
+
+_RULE_REASONS = (
+    (DECISION_MAKER_ROLE, 20, "Decision maker role (+20)"),
+    (INFLUENCER_ROLE, 10, "Influencer role (+10)"),
+    (EXACT_ICP_MATCH, 20, "Exact ICP match (+20)"),
+    (ADJACENT_INDUSTRY, 10, "Adjacent industry (+10)"),
+    (COMPLETE_PROFILE, 10, "Complete profile (+10)"),
+)
+
+# Lookup tables indexed by flag value, covering every combination
+_SCORE_BY_FLAGS = tuple(
+    sum(points for flag, points, _ in _RULE_REASONS if flags & flag)
+    for flags in range(1 << len(_RULE_REASONS))
+)
+_REASONS_BY_FLAGS = tuple(
+    tuple(reason for flag, _, reason in _RULE_REASONS if flags & flag)
+    for flags in range(1 << len(_RULE_REASONS))
+)
+
+def flags_to_score(flags: int) -> int:
+    """Rule score (0-50) for a combination of rule flags."""
+    return _SCORE_BY_FLAGS[flags]
+
+def flags_to_reasons(flags: int) -> List[str]:
+    """Human-readable reasons for a combination of rule flags, in criterion order."""
+    return list(_REASONS_BY_FLAGS[flags])
+
+@dataclass
+class LeadVO:
+    """
+    Lead value object read by the rule layer.
+    
+    Fields are slots, so scoring reads them as attributes instead of dict
+    lookups. Lead model instances expose the same attributes and can be
+    passed wherever a LeadVO is expected.
+    """
+    __slots__ = REQUIRED_FIELDS
+
+    name: Optional[str]
+    role: str
+    company: Optional[str]
+    industry: str
+    location: Optional[str]
+    linkedin_bio: Optional[str]
+
+    @classmethod
+    def from_dict(cls, lead: Dict) -> 'LeadVO':
+        """Build from a lead dict; missing role/industry default to '' as before."""
+        return cls(
+            name=lead.get('name'),
+            role=lead.get('role', ''),
+            company=lead.get('company'),
+            industry=lead.get('industry', ''),
+            location=lead.get('location'),
+            linkedin_bio=lead.get('linkedin_bio'),
+        )
+
+def prepare_offer(offer: Dict) -> Dict:
+    """
+    Precompute offer-derived lookups used by calculate_rule_score.
+    
+    The ICP list is identical for every lead scored against an offer, so it is
+    lowercased once here instead of once per lead. Call this before a batch loop
+    and pass the returned dict to calculate_rule_score.
+    
+    Args:
+        offer (Dict): Offer information containing ideal_use_cases
+    
+    Returns:
+        Dict: Copy of the offer with '_ideal_use_cases_lc', a frozenset of
+        lowercased ideal use cases
+    """
+    prepared = dict(offer)
+    # Interned so the exact-match set lookup can succeed on identity alone
+    prepared['_ideal_use_cases_lc'] = frozenset(
+        sys.intern(use_case.lower()) for use_case in offer.get('ideal_use_cases', [])
+    )
+    return prepared
 
 def calculate_rule_score(lead: Dict, offer: Dict) -> Tuple[int, List[str]]:
     """
@@ -27,6 +141,7 @@ def calculate_rule_score(lead: Dict, offer: Dict) -> Tuple[int, List[str]]:
         offer (Dict): Offer information containing:
             - ideal_use_cases: List of target industries/segments (ICP)
             - value_props: Product value propositions
+            May be the output of prepare_offer() to skip per-call ICP lowercasing.
     
     Returns:
         Tuple[int, List[str]]: 
@@ -51,66 +166,148 @@ def calculate_rule_score(lead: Dict, offer: Dict) -> Tuple[int, List[str]]:
         >>> print(reasons)
         ['Decision maker role (+20)', 'Exact ICP match (+20)', 'Complete profile (+10)']
     """
-    score = 0
-    reasons = []
-
-    # ============================================================================
-    # CRITERION 1: Role Relevance (0-20 points)
-    # ============================================================================
-    # Decision makers have budget authority and can make final purchase decisions
-    # These roles typically control B2B buying decisions
-    decision_makers = ['ceo', 'cto', 'cfo', 'vp', 'head', 'director', 'founder', 'owner', 'president']
-    
-    # Influencers can advocate for the product but usually need approval
-    # They're important in the buying process but not final decision makers
-    influencers = ['manager', 'lead', 'architect', 'senior', 'principal']
-    
-    role = lead.get('role', '').lower()
-    
-    if any(dm in role for dm in decision_makers):
-        score += 20
-        reasons.append("Decision maker role (+20)")
-    elif any(inf in role for inf in influencers):
-        score += 10
-        reasons.append("Influencer role (+10)")
-    else:
-        # No points for roles without clear buying authority
-        pass
-
-    # ============================================================================
-    # CRITERION 2: Industry Match (0-20 points)
-    # ============================================================================
-    # Prioritize leads from industries matching the offer's ideal customer profile (ICP)
-    # Exact matches indicate perfect product-market fit
-    industry = lead.get('industry', '').lower()
-    ideal_use_cases = offer.get('ideal_use_cases', [])
-    
-    # Check for exact match first (case-insensitive)
-    if any(industry == use_case.lower() for use_case in ideal_use_cases):
-        score += 20
-        reasons.append("Exact ICP match (+20)")
+    return calculate_rule_score_vo(LeadVO.from_dict(lead), offer)
+
+def calculate_rule_score_vo(lead: LeadVO, offer: Dict) -> Tuple[int, List[str]]:
+    """
+    Attribute-based variant of calculate_rule_score.
+    
+    Args:
+        lead (LeadVO): Lead value object (or a Lead model instance)
+        offer (Dict): Offer information, raw or passed through prepare_offer()
+    
+    Returns:
+        Tuple[int, List[str]]: Same (score, reasons) as calculate_rule_score
+    """
+    flags = make_scorer(offer)(lead)
+    return flags_to_score(flags), flags_to_reasons(flags)
+
+def make_scorer(offer: Dict) -> Callable[[LeadVO], int]:
+    """
+    Specialize the rule layer for one offer.
+    
+    The returned function closes over the offer's prepared ICP set and the
+    criterion helpers, so scoring a lead involves no offer lookups at all.
+    Build one scorer per batch and call it for every lead.
+    
+    Args:
+        offer (Dict): Offer information containing ideal_use_cases, raw or
+            already passed through prepare_offer()
+    
+    Returns:
+        Callable[[LeadVO], int]: Function taking a LeadVO (or Lead model
+        instance) and returning its rule flags; convert them with
+        flags_to_score / flags_to_reasons
+    """
+    ideal_use_cases = offer.get('_ideal_use_cases_lc')
+    if ideal_use_cases is None:
+        ideal_use_cases = prepare_offer(offer)['_ideal_use_cases_lc']
+
+    # Bind helpers as locals: closure lookups are cheaper than module globals
+    role_flags = _role_flags
+    industry_flags = _industry_flags
+    completeness_flags = _completeness_flags
+
+    def scorer(lead: LeadVO) -> int:
+        return (
+            role_flags(lead.role)
+            | industry_flags(lead.industry, ideal_use_cases)
+            | completeness_flags(lead)
+        )
+
+    return scorer
+
+def score_leads_bulk(leads: Iterable[LeadVO], offer: Dict) -> List[int]:
+    """
+    Apply the rule layer to a batch of leads scored against the same offer.
+    
+    Specializes a scorer for the offer once (see make_scorer). The rule result
+    depends only on (role, industry, profile completeness), and real lead lists
+    repeat a small set of those combinations, so each distinct combination is
+    scored once and its flags are reused for every matching lead. Results are
+    plain ints; nothing is allocated per lead until the caller materializes
+    them. Single-lead callers should keep using calculate_rule_score.
+    
+    Args:
+        leads (Iterable[LeadVO]): LeadVO objects, or Lead model instances
+            directly since they expose the same attributes
+        offer (Dict): Offer information containing ideal_use_cases
+    
+    Returns:
+        List[int]: Rule flags per lead, in input order. Use flags_to_score and
+        flags_to_reasons to turn them into points and explanations.
+    """
+    scorer = make_scorer(offer)
+    flags_by_key = {}
+    results = []
+    for lead in leads:
+        key = (lead.role, lead.industry, _completeness_flags(lead))
+        flags = flags_by_key.get(key)
+        if flags is None:
+            flags = flags_by_key[key] = scorer(lead)
+        results.append(flags)
+    return results
+
+# The role and industry criteria are pure functions of a few repeated strings,
+# so results are memoized; the ICP frozenset is hashable and keys the offer.
+_CRITERIA_CACHE_SIZE = 4096
+
+# ============================================================================
+# CRITERION 1: Role Relevance (0-20 points)
+# ============================================================================
+@lru_cache(maxsize=_CRITERIA_CACHE_SIZE)
+def _role_flags(role: str) -> int:
+    """Classify a job title; keyword lists live in DECISION_MAKER_KEYWORDS / INFLUENCER_KEYWORDS."""
+    influencer = False
+    for match in _ROLE_RE.finditer(role):
+        if match.lastgroup == 'decision_maker':
+            # Decision makers outrank influencers, so stop at the first hit
+            return DECISION_MAKER_ROLE
+        influencer = True
+    if influencer:
+        return INFLUENCER_ROLE
+    # No points for roles without clear buying authority
+    return 0
+
+# ============================================================================
+# CRITERION 2: Industry Match (0-20 points)
+# ============================================================================
+@lru_cache(maxsize=_CRITERIA_CACHE_SIZE)
+def _industry_flags(industry: str, ideal_use_cases: FrozenSet[str]) -> int:
+    """
+    Classify an industry against the offer's lowercased ICP set.
+    
+    Prioritize leads from industries matching the offer's ideal customer profile (ICP)
+    Exact matches indicate perfect product-market fit
+    """
+    industry = sys.intern(industry.lower())
+
+    # Check for exact match first (case-insensitive set lookup)
+    if industry in ideal_use_cases:
+        return EXACT_ICP_MATCH
     # Check for partial/adjacent match (industry contains ICP keyword)
-    elif any(icp.lower() in industry or industry in icp.lower() for icp in ideal_use_cases):
-        score += 10
-        reasons.append("Adjacent industry (+10)")
-    else:
-        # No points for industries outside target ICP
-        pass
-
-    # ============================================================================
-    # CRITERION 3: Data Completeness (0-10 points)
-    # ============================================================================
-    # Complete profiles indicate:
-    # - Higher quality leads (more engaged prospects)
-    # - Better data for AI analysis layer
-    # - More reliable scoring outcomes
-    required_fields = ['name', 'role', 'company', 'industry', 'location', 'linkedin_bio']
-    
-    if all(lead.get(field) and str(lead.get(field)).strip() for field in required_fields):
-        score += 10
-        reasons.append("Complete profile (+10)")
-    else:
-        # Missing fields reduce confidence in lead quality
-        pass
-
-    return score, reasons
\ No newline at end of file
+    if any(icp in industry or industry in icp for icp in ideal_use_cases):
+        return ADJACENT_INDUSTRY
+    # No points for industries outside target ICP
+    return 0
+
+# ============================================================================
+# CRITERION 3: Data Completeness (0-10 points)
+# ============================================================================
+def _completeness_flags(lead: LeadVO) -> int:
+    """
+    Flag leads whose REQUIRED_FIELDS values are all filled in.
+    
+    Complete profiles indicate:
+    - Higher quality leads (more engaged prospects)
+    - Better data for AI analysis layer
+    - More reliable scoring outcomes
+    """
+    # One C-level attrgetter call fetches every field; only strings need the whitespace check
+    if all(
+        value and (not isinstance(value, str) or value.strip())
+        for value in _required_values(lead)
+    ):
+        return COMPLETE_PROFILE
+    # Missing fields reduce confidence in lead quality
+    return 0
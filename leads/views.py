@@ -1,17 +1,208 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.http import HttpResponse
-from .models import Offer, Lead
-from .serializers import OfferSerializer, LeadSerializer
-from .utils import calculate_rule_score
+from django.http import StreamingHttpResponse
+from .models import Offer, Lead, ScoringJob
+from .serializers import OfferSerializer, LeadSerializer, LeadListSerializer
+from .ratelimit import RateLimiter, estimate_tokens
+from .utils import REQUIRED_FIELDS, flags_to_reasons, flags_to_score, prepare_offer, score_leads_bulk
+import asyncio
+import functools
+import hashlib
 import csv
 import io
+import itertools
+import json
+import logging
+import textwrap
+import threading
+from datetime import timedelta
+from asgiref.sync import async_to_sync
 from django.conf import settings
-from openai import OpenAI, RateLimitError
-from django.db.models import Max, Q
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from django.db.models import Exists, OuterRef, Q
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+# Columns written by export_csv, in order
+EXPORT_HEADER = ['Name', 'Role', 'Company', 'Industry', 'Location', 'Intent', 'Score', 'Reasoning']
+EXPORT_FIELDS = ('name', 'role', 'company', 'industry', 'location', 'intent', 'score', 'reasoning')
+
+# CSV rows parsed and inserted per bulk_create during upload
+UPLOAD_BATCH_SIZE = 1000
+
+# Leads classified per AI request; the offer context is sent once per request
+AI_BATCH_SIZE = 20
+# Completion budget per lead; also counted against the tokens-per-minute limit
+AI_MAX_TOKENS = 150
+# How long a lead's AI classification is reused for an identical prompt
+AI_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+# Map AI intent classification to points (as per assignment requirements)
+AI_INTENT_POINTS = {
+    'High': 50,
+    'Medium': 30,
+    'Low': 10
+}
+# Final intent for every possible final score (0-100): High >= 70, Medium >= 40
+INTENT_BY_SCORE = tuple(
+    'High' if score >= 70 else 'Medium' if score >= 40 else 'Low'
+    for score in range(101)
+)
+# Placeholder for leads missing from an AI reply; never cached
+AI_FORMAT_ERROR = (10, "Low", "AI response format error")
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """
+    Shared synchronous OpenAI client, used for Batch API file and job calls.
+    
+    Built on first use rather than at import. The openai package (and httpx
+    behind it) is only imported inside the scoring code paths, so management
+    commands such as migrate never load it.
+    """
+    from openai import OpenAI
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        max_retries=settings.OPENAI_MAX_RETRIES
+    )
+
+logger = logging.getLogger(__name__)
+
+# Batch API states after which a job no longer changes; background jobs use the same names
+BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+def _stale_job_cutoff():
+    """Jobs without a heartbeat since this are assumed lost with their worker."""
+    return timezone.now() - timedelta(minutes=settings.SCORING_JOB_TIMEOUT_MINUTES)
+
+def _unclaimed_leads():
+    """
+    Filter for leads a scoring run may pick up: never claimed, or claimed by
+    a job that will no longer write scores. Jobs without a batch_id run in the
+    worker process (background thread, or a batch still being uploaded) and
+    die with it, so one that has not updated its heartbeat for
+    SCORING_JOB_TIMEOUT_MINUTES no longer holds its leads.
+    """
+    return (
+        Q(scoring_job__isnull=True)
+        | Q(scoring_job__status__in=BATCH_FINAL_STATUSES)
+        | Q(scoring_job__batch_id__isnull=True, scoring_job__updated_at__lt=_stale_job_cutoff())
+    )
+
+# Shared by every classification request; the message dict is never mutated
+AI_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an AI trained to analyze B2B lead buying intent by matching prospect profiles against product offerings."
+}
+
+# Per-request classification prompt, filled in by _build_ai_messages. Dedented
+# so multi-line values such as the offer block need no indentation of their own.
+AI_USER_PROMPT = textwrap.dedent("""\
+    Analyze each lead's buying intent for our product:
+
+    OUR PRODUCT/OFFER:
+    {offer_block}
+
+    LEAD PROFILES (JSON array, each with index "i"):
+    {profiles}
+
+    For each lead, evaluate:
+    1. Does their role indicate decision-making authority?
+    2. Does their industry/company match our ICP?
+    3. Does their bio show relevant experience or pain points our product solves?
+    4. Overall likelihood they would be interested in our offer
+
+    Classify each lead's buying intent as High, Medium, or Low.
+    Provide 1-2 sentences explaining each classification.
+
+    Reply with a JSON object containing one result per lead:
+    {{"results": [{{"i": 0, "intent": "High", "reason": "VP of Sales in B2B SaaS matches ICP perfectly. Bio mentions scaling outreach challenges."}}]}}
+""")
+
+def _format_offer_block(offer):
+    """Offer context for the AI prompt; built once per scoring run."""
+    return '\n'.join([
+        f"- Product: {offer.name}",
+        f"- Value Propositions: {', '.join(offer.value_props)}",
+        f"- Ideal Customer Profile: {', '.join(offer.ideal_use_cases)}",
+    ])
+
+def _lead_profile(lead):
+    """Lead fields sent to the AI layer."""
+    return {
+        'name': lead.name,
+        'role': lead.role,
+        'company': lead.company,
+        'industry': lead.industry,
+        'location': lead.location,
+        'linkedin_bio': lead.linkedin_bio
+    }
+
+def _ai_cache_key(offer_block, lead):
+    """Cache key for a lead's AI result: hash of everything its prompt depends on."""
+    prompt = offer_block + json.dumps(_lead_profile(lead), sort_keys=True)
+    return 'ai_intent:' + hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+def _chunk_leads(leads):
+    """Split a list of leads into AI_BATCH_SIZE slices, one per AI request."""
+    for i in range(0, len(leads), AI_BATCH_SIZE):
+        yield leads[i:i + AI_BATCH_SIZE]
+
+def _parse_ai_intents(content, count):
+    """
+    Parse a batched AI reply into one (ai_score, intent, reasoning) tuple per lead.
+    
+    Expects {"results": [{"i": 0, "intent": "High", "reason": "..."}, ...]}.
+    Leads the reply skips or garbles get the same low default as a
+    malformed single reply.
+    """
+    parsed = [AI_FORMAT_ERROR] * count
+    try:
+        entries = json.loads(content)['results']
+    except (ValueError, TypeError, KeyError):
+        return parsed
+    if not isinstance(entries, list):
+        return parsed
+    
+    for entry in entries:
+        try:
+            i = int(entry['i'])
+            intent = str(entry['intent']).strip()
+            reasoning = str(entry.get('reason', '')).strip()
+        except (ValueError, TypeError, KeyError, AttributeError):
+            continue
+        if 0 <= i < count:
+            parsed[i] = (AI_INTENT_POINTS.get(intent, 10), intent, reasoning)
+    return parsed
+
+def _parse_batch_output(text):
+    """
+    Map a Batch API output file to {lead_id: (ai_score, intent, reasoning)}.
+    
+    Each JSONL line answers one request; its custom_id lists the ids of the
+    leads the request carried, in prompt order. Failed requests are skipped,
+    so their leads stay unscored and are picked up by the next run.
+    """
+    ai_by_lead = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get('response') or {}
+        if response.get('status_code') != 200:
+            continue
+        lead_ids = [int(lead_id) for lead_id in record['custom_id'].split(',')]
+        content = response['body']['choices'][0]['message']['content']
+        ai_by_lead.update(zip(lead_ids, _parse_ai_intents(content, len(lead_ids))))
+    return ai_by_lead
+
+class Echo:
+    """
+    Pseudo-buffer whose write() returns the value instead of storing it.
+    Lets csv.writer produce one line at a time for StreamingHttpResponse.
+    """
+    def write(self, value):
+        return value
 
 class OfferViewSet(viewsets.ModelViewSet):
     """
@@ -29,6 +220,19 @@ class LeadViewSet(viewsets.ModelViewSet):
     queryset = Lead.objects.all()
     serializer_class = LeadSerializer
 
+    def get_serializer_class(self):
+        """Use the compact serializer for collection endpoints."""
+        if self.action in ('list', 'results'):
+            return LeadListSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        """Load only the compact serializer's columns for the list endpoint."""
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.only(*LeadListSerializer.Meta.fields)
+        return queryset
+
     def _get_unique_leads(self, scored_only=False):
         """
         Helper to get unique leads by company and name.
@@ -38,12 +242,53 @@ class LeadViewSet(viewsets.ModelViewSet):
         if scored_only:
             base_query = base_query.filter(score__isnull=False)
         
-        # Get the latest record for each company/name combination
-        latest_leads = base_query.values('company', 'name').annotate(
-            latest_id=Max('id')
-        ).values('latest_id')
+        # Keep the latest record for each company/name combination: a row
+        # survives when no newer row with the same company and name exists.
+        # This is a single anti-join rather than an IN list of ids.
+        newer_duplicate = base_query.filter(
+            company=OuterRef('company'),
+            name=OuterRef('name'),
+            id__gt=OuterRef('id')
+        )
         
-        return base_query.filter(id__in=latest_leads)
+        return base_query.filter(~Exists(newer_duplicate))
+
+    def _unscored_leads(self):
+        """Unique unscored leads that no pending scoring job has claimed."""
+        return self._get_unique_leads().filter(_unclaimed_leads(), score__isnull=True)
+
+    def _get_unscored_leads(self):
+        """
+        Load the leads from _unscored_leads.
+        Only loads the columns the pipeline reads; scoring fields are assigned later.
+        """
+        return list(self._unscored_leads().only('id', *REQUIRED_FIELDS))
+
+    def _start_job(self, offer, job_status):
+        """
+        Create a ScoringJob and claim every unscored lead for it, atomically.
+        
+        The claim is one conditional UPDATE over a subquery, so when two
+        requests race each lead goes to exactly one job, and the statement
+        binds no per-lead parameters however many leads there are. Claimed
+        leads are skipped by other scoring runs until the job is final.
+        
+        Returns:
+            tuple: (job, leads) with the claimed leads loaded as in
+            _get_unscored_leads, or (None, []) if there was nothing to claim
+        """
+        with transaction.atomic():
+            job = ScoringJob.objects.create(offer=offer, status=job_status, total_leads=0)
+            Lead.objects.filter(id__in=self._unscored_leads().values('id')).update(scoring_job=job)
+            # Not job.leads: the reverse manager would set scoring_job on every
+            # lead, loading the deferred column once per row
+            leads = list(Lead.objects.filter(scoring_job=job).only('id', *REQUIRED_FIELDS).order_by('id'))
+            if not leads:
+                job.delete()
+                return None, []
+            job.total_leads = len(leads)
+            job.save(update_fields=['total_leads'])
+        return job, leads
 
     @action(detail=False, methods=['get'])
     def results(self, request):
@@ -52,7 +297,12 @@ class LeadViewSet(viewsets.ModelViewSet):
         Returns only leads that have been scored, ordered by score (highest first).
         """
         try:
-            leads = self._get_unique_leads(scored_only=True).order_by('-score', 'company', 'name')
+            # Only load the columns the compact serializer renders; skips linkedin_bio
+            leads = (
+                self._get_unique_leads(scored_only=True)
+                .only(*LeadListSerializer.Meta.fields)
+                .order_by('-score', 'company', 'name')
+            )
             page = self.paginate_queryset(leads)
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
@@ -76,12 +326,19 @@ class LeadViewSet(viewsets.ModelViewSet):
             if not csv_file.name.endswith('.csv'):
                 return Response({'error': 'File must be CSV format'}, status=400)
 
-            decoded_file = csv_file.read().decode('utf-8')
-            csv_data = csv.DictReader(io.StringIO(decoded_file))
+            # Decode rows straight from the upload stream instead of reading
+            # the whole file into one string first
+            csv_data = csv.DictReader(
+                io.TextIOWrapper(csv_file.file, encoding='utf-8', newline='')
+            )
             leads = []
-            for row in csv_data:
-                lead = Lead.objects.create(**row)
-                leads.append(lead)
+            
+            # One INSERT per UPLOAD_BATCH_SIZE rows, all committed together
+            with transaction.atomic():
+                for rows in iter(lambda: list(itertools.islice(csv_data, UPLOAD_BATCH_SIZE)), []):
+                    batch = [Lead(**row) for row in rows]
+                    Lead.objects.bulk_create(batch)
+                    leads.extend(batch)
             
             serializer = LeadSerializer(leads, many=True)
             return Response(serializer.data, status=201)
@@ -92,92 +349,314 @@ class LeadViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _get_ai_intent_score(self, lead, offer):
+    async def _get_ai_intent_scores(self, leads, offer, on_progress=None):
         """
-        Get AI-based intent classification and score (0-50 points).
+        Run the AI layer for a batch of leads concurrently.
         
-        Uses OpenAI GPT-3.5-Turbo to analyze lead profile against offer context.
-        Maps intent classification to points: High=50, Medium=30, Low=10
+        Leads whose exact prompt was classified recently are answered from the
+        cache. The rest are sent AI_BATCH_SIZE per request so the offer
+        context is paid for once per request instead of once per lead.
+        Requests are issued together but throttled by a semaphore, so at most
+        OPENAI_MAX_CONCURRENCY calls are in flight at once, and paced by a
+        RateLimiter so the batch stays within the per-minute limits.
         
         Args:
-            lead: Lead model instance
+            leads: Lead model instances
             offer: Offer model instance
+            on_progress: Optional coroutine function awaited after every request
             
         Returns:
-            tuple: (ai_score: int, intent: str, reasoning: str)
+            list: One (ai_score, intent, reasoning) tuple per lead, in input
+            order, or the exception raised for that lead's request
+        """
+        from openai import AsyncOpenAI  # deferred, see get_openai_client
+        
+        # The offer part of the prompt is identical for every request in the run
+        offer_block = _format_offer_block(offer)
+        
+        # Re-uploaded or duplicate profiles reuse an earlier classification
+        keys = [_ai_cache_key(offer_block, lead) for lead in leads]
+        cached = await cache.aget_many(keys)
+        pending = [lead for lead, key in zip(leads, keys) if key not in cached]
+        if not pending:
+            return [cached[key] for key in keys]
+        
+        semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        limiter = RateLimiter(
+            settings.OPENAI_MAX_REQUESTS_PER_MINUTE,
+            settings.OPENAI_MAX_TOKENS_PER_MINUTE
+        )
+        chunks = list(_chunk_leads(pending))
+        
+        # The async client owns a connection pool tied to this event loop,
+        # so it lives for one batch and is closed afterwards
+        async with AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            max_retries=settings.OPENAI_MAX_RETRIES
+        ) as client:
+            async def bounded(chunk):
+                async with semaphore:
+                    try:
+                        return await self._get_ai_intent_batch(client, limiter, chunk, offer_block)
+                    finally:
+                        if on_progress is not None:
+                            await on_progress()
+            
+            chunk_results = await asyncio.gather(
+                *[bounded(chunk) for chunk in chunks],
+                return_exceptions=True
+            )
+        
+        fresh = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                # A failed request fails every lead it carried
+                fresh.extend([chunk_result] * len(chunk))
+            else:
+                fresh.extend(chunk_result)
+        
+        fresh = iter(fresh)
+        return [cached[key] if key in cached else next(fresh) for key in keys]
+
+    async def _get_ai_intent_batch(self, client, limiter, leads, offer_block):
+        """
+        Get AI-based intent classifications and scores (0-50 points) for up to
+        AI_BATCH_SIZE leads in one request.
+        
+        Uses OpenAI GPT-3.5-Turbo to analyze lead profiles against offer context.
+        Maps intent classification to points: High=50, Medium=30, Low=10
+        
+        Args:
+            client: AsyncOpenAI client shared by the batch
+            limiter: RateLimiter shared by the batch
+            leads: Lead model instances
+            offer_block: Offer context from _format_offer_block
+            
+        Returns:
+            list: One (ai_score: int, intent: str, reasoning: str) tuple per lead
                 - ai_score: 0-50 points based on intent classification
                 - intent: "High", "Medium", or "Low"
                 - reasoning: AI's explanation for the classification
         """
+        from openai import RateLimitError  # deferred, see get_openai_client
+        
         try:
-            # Construct prompt with both lead profile AND offer context
-            # This allows AI to evaluate fit between prospect and product
-            messages = [{
-                "role": "system",
-                "content": "You are an AI trained to analyze B2B lead buying intent by matching prospect profiles against product offerings."
-            }, {
-                "role": "user",
-                "content": f"""
-                Analyze this lead's buying intent for our product:
+            messages = self._build_ai_messages(leads, offer_block)
+            
+            # Call OpenAI API (transient failures are retried by the client)
+            result = await self._call_openai(client, limiter, messages, len(leads))
+            parsed = _parse_ai_intents(result, len(leads))
+            
+            # Only real classifications are cached; errors are retried next run
+            await cache.aset_many({
+                _ai_cache_key(offer_block, lead): ai_result
+                for lead, ai_result in zip(leads, parsed)
+                if ai_result != AI_FORMAT_ERROR
+            }, timeout=AI_CACHE_TIMEOUT)
+            
+            return parsed
+            
+        except RateLimitError:
+            # Still rate limited after retries; the caller falls back to rule-only scoring
+            raise
+        except Exception as e:
+            # Return default low score on any error
+            return [(10, "Low", f"AI scoring error: {str(e)}")] * len(leads)
+
+    def _build_ai_messages(self, leads, offer_block):
+        """
+        Build the chat messages classifying up to AI_BATCH_SIZE leads against
+        the offer context from _format_offer_block.
+        """
+        # Construct prompt with the offer context once and every lead profile
+        # This allows AI to evaluate fit between each prospect and the product
+        profiles = json.dumps([
+            {'i': i, **_lead_profile(lead)} for i, lead in enumerate(leads)
+        ])
+        
+        return [AI_SYSTEM_MESSAGE, {
+            "role": "user",
+            "content": AI_USER_PROMPT.format(offer_block=offer_block, profiles=profiles)
+        }]
+
+    async def _call_openai(self, client, limiter, messages, lead_count):
+        """
+        Send one JSON-mode chat completion request and return the reply text.
+        
+        The client retries rate limits, timeouts and connection errors with
+        exponential backoff and jitter (OPENAI_MAX_RETRIES attempts) before
+        raising, so only persistent failures reach the caller.
+        """
+        request = self._build_ai_request(messages, lead_count)
+        # Wait for rate-limit capacity before dispatching
+        await limiter.acquire(estimate_tokens(messages, request['max_tokens']))
+        response = await client.chat.completions.create(**request)
+        return response.choices[0].message.content
+
+    def _build_ai_request(self, messages, lead_count):
+        """Chat completion parameters for one batched classification request."""
+        return {
+            'model': "gpt-3.5-turbo",
+            'messages': messages,
+            'temperature': 0.3,  # Low temperature for consistent classifications
+            'max_tokens': AI_MAX_TOKENS * lead_count,
+            'response_format': {"type": "json_object"}
+        }
+
+    def _get_rule_flags(self, leads, offer):
+        """Apply the rule layer to a batch of leads scored against one offer."""
+        # ICP lookups only depend on the offer, so build them once per batch
+        offer_dict = prepare_offer({
+            'ideal_use_cases': offer.ideal_use_cases,
+            'value_props': offer.value_props
+        })
+        # Lead instances expose the LeadVO attributes, so they are scored as-is
+        return score_leads_bulk(leads, offer_dict)
+
+    def _save_scores(self, leads, rule_flags, ai_results):
+        """
+        Combine rule and AI results into final scores and write them back in bulk.
+        
+        Args:
+            leads: Lead model instances
+            rule_flags: Rule flags per lead from score_leads_bulk
+            ai_results: (ai_score, intent, reasoning) tuple per lead, or the
+                exception raised while scoring it
+            
+        Returns:
+            list: Result dicts for the leads that were scored
+        """
+        from openai import RateLimitError  # deferred, see get_openai_client
+        
+        results = []
+        # Scored leads are written back in bulk after the loop
+        scored_leads = []
+        
+        for lead, flags, ai_result in zip(leads, rule_flags, ai_results):
+            rule_score = flags_to_score(flags)
+            rule_reasons = flags_to_reasons(flags)
+            try:
+                # Errors raised for this lead during the batch are handled below
+                if isinstance(ai_result, Exception):
+                    raise ai_result
+                ai_score, ai_intent, ai_reasoning = ai_result
                 
-                LEAD PROFILE:
-                - Name: {lead.name}
-                - Role: {lead.role}
-                - Company: {lead.company}
-                - Industry: {lead.industry}
-                - Location: {lead.location}
-                - LinkedIn Bio: {lead.linkedin_bio}
+                # Combine scores (HYBRID APPROACH)
+                # Final Score = Rule Score + AI Score (max 100)
+                final_score = min(rule_score + ai_score, 100)
                 
-                OUR PRODUCT/OFFER:
-                - Product: {offer.name}
-                - Value Propositions: {', '.join(offer.value_props)}
-                - Ideal Customer Profile: {', '.join(offer.ideal_use_cases)}
+                # Classify final intent based on combined score
+                final_intent = INTENT_BY_SCORE[final_score]
                 
-                Evaluate:
-                1. Does their role indicate decision-making authority?
-                2. Does their industry/company match our ICP?
-                3. Does their bio show relevant experience or pain points our product solves?
-                4. Overall likelihood they would be interested in our offer
+                # Combine reasoning from both layers
+                combined_reasoning = f"[Rule: {', '.join(rule_reasons)}] [AI: {ai_reasoning}]"
                 
-                Classify their buying intent as High, Medium, or Low.
-                Provide 1-2 sentences explaining your classification.
+                # Stage results for the bulk update below
+                lead.score = final_score
+                lead.intent = final_intent
+                lead.reasoning = combined_reasoning
+                scored_leads.append(lead)
                 
-                Format: Intent|Reasoning
-                Example: High|VP of Sales in B2B SaaS matches ICP perfectly. Bio mentions scaling outreach challenges.
-                """
-            }]
-            
-            # Call OpenAI API
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                temperature=0.3,  # Low temperature for consistent classifications
-                max_tokens=150
-            )
-            
-            # Parse response (format: "Intent|Reasoning")
-            result = response.choices[0].message.content.strip()
-            if '|' not in result:
-                # Fallback if format is incorrect
-                return 10, "Low", "AI response format error"
+                results.append({
+                    'name': lead.name,
+                    'role': lead.role,
+                    'company': lead.company,
+                    'intent': final_intent,
+                    'score': final_score,
+                    'reasoning': combined_reasoning,
+                    'score_breakdown': {
+                        'rule_score': rule_score,
+                        'ai_score': ai_score
+                    }
+                })
                 
-            intent, reasoning = result.split('|', 1)
-            intent = intent.strip()
-            
-            # Map intent classification to points (as per assignment requirements)
-            intent_map = {
-                'High': 50,
-                'Medium': 30,
-                'Low': 10
-            }
-            
-            ai_score = intent_map.get(intent, 10)
-            
-            return ai_score, intent, reasoning.strip()
+            except RateLimitError:
+                # Fallback: Use only rule-based score if AI rate limited
+                final_score = min(rule_score * 2, 100)  # Scale up rule score to 0-100 range
+                final_intent = INTENT_BY_SCORE[final_score]
+                fallback_reasoning = f"[Rule-based only - AI rate limited] {', '.join(rule_reasons)}"
+                
+                lead.score = final_score
+                lead.intent = final_intent
+                lead.reasoning = fallback_reasoning
+                scored_leads.append(lead)
+                
+                results.append({
+                    'name': lead.name,
+                    'role': lead.role,
+                    'company': lead.company,
+                    'intent': final_intent,
+                    'score': final_score,
+                    'reasoning': fallback_reasoning
+                })
             
-        except Exception as e:
-            # Return default low score on any error
-            return 10, "Low", f"AI scoring error: {str(e)}"
+            except Exception as lead_error:
+                # Log individual lead errors but continue processing others
+                print(f"Error scoring lead {lead.name}: {str(lead_error)}")
+                continue
+        
+        # Save results to database: one UPDATE per 500 leads, committed together
+        with transaction.atomic():
+            Lead.objects.bulk_update(scored_leads, ['score', 'intent', 'reasoning'], batch_size=500)
+        
+        return results
+
+    def _run_scoring(self, leads, offer, on_progress=None):
+        """
+        Run the full hybrid pipeline on a batch of leads and save the results.
+        
+        Args:
+            on_progress: Optional coroutine function awaited after every AI request
+        
+        Returns:
+            list: Result dicts for the leads that were scored
+        """
+        # STEP 1: Calculate Rule-Based Scores (0-50 points) for the whole batch
+        # This uses objective criteria: role seniority, industry match, data completeness
+        rule_flags = self._get_rule_flags(leads, offer)
+        
+        # STEP 2: Calculate AI Scores (0-50 points) for the whole batch
+        # This uses OpenAI to classify intent: High=50, Medium=30, Low=10
+        # Calls run concurrently; the caller stays synchronous
+        if settings.OPENAI_API_KEY:
+            ai_results = async_to_sync(self._get_ai_intent_scores)(leads, offer, on_progress)
+        else:
+            # If no API key, default to low AI score
+            ai_results = [(10, "Low", "No AI API key configured")] * len(leads)
+        
+        # STEP 3: Combine scores and save them
+        return self._save_scores(leads, rule_flags, ai_results)
+
+    def _run_scoring_job(self, job, leads):
+        """
+        Background thread body for POST /api/leads/score/?background=true.
+        
+        Records the outcome on the ScoringJob, which GET
+        /api/leads/score_status/<job_id>/ reports. The job's updated_at is
+        touched after every AI request, so a long run is not mistaken for one
+        lost in a worker restart. A job already marked failed as stale keeps
+        that status.
+        """
+        async def heartbeat():
+            await ScoringJob.objects.filter(id=job.id, status='in_progress').aupdate(
+                updated_at=timezone.now()
+            )
+        
+        total_scored = None
+        job_status = 'failed'
+        try:
+            total_scored = len(self._run_scoring(leads, job.offer, on_progress=heartbeat))
+            job_status = 'completed'
+        except Exception:
+            logger.exception("Background scoring job %s failed", job.id)
+            job_status = 'failed'
+        finally:
+            now = timezone.now()
+            ScoringJob.objects.filter(id=job.id, status='in_progress').update(
+                status=job_status, total_scored=total_scored, completed_at=now, updated_at=now
+            )
+            # Threads outside the request cycle must close their own connection
+            connection.close()
 
     @action(detail=False, methods=['post'])
     def score(self, request):
@@ -194,6 +673,10 @@ class LeadViewSet(viewsets.ModelViewSet):
         - Medium: Final score >= 40
         - Low: Final score < 40
         
+        Pass ?background=true to score in a worker thread instead: the
+        request returns 202 with a job_id right away, and
+        GET /api/leads/score_status/<job_id>/ reports progress.
+        
         Returns:
             JSON with array of scored leads containing:
             - name, role, company, intent, score, reasoning
@@ -207,102 +690,36 @@ class LeadViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Get only unscored unique leads to avoid re-scoring
-            leads = self._get_unique_leads().filter(score__isnull=True)
+            # Get only unscored unique leads to avoid re-scoring; leads held
+            # by a pending batch or background job are left to that job
+            leads = self._get_unscored_leads()
             
-            if not leads.exists():
+            if not leads:
                 return Response(
                     {'message': 'No unscored leads found. Upload leads using POST /api/leads/upload/'}, 
                     status=status.HTTP_200_OK
                 )
             
-            results = []
+            if request.query_params.get('background', '').lower() in ('1', 'true', 'yes'):
+                # Free the HTTP worker; the thread records the outcome on the job.
+                # Claimed leads are skipped by other runs while the job is in progress.
+                job, leads = self._start_job(offer, 'in_progress')
+                if job is None:
+                    # Another request claimed them first
+                    return Response(
+                        {'message': 'No unscored leads found. Upload leads using POST /api/leads/upload/'}, 
+                        status=status.HTTP_200_OK
+                    )
+                threading.Thread(
+                    target=self._run_scoring_job, args=(job, leads), daemon=True
+                ).start()
+                return Response({
+                    'job_id': job.id,
+                    'status': job.status,
+                    'total_leads': job.total_leads
+                }, status=status.HTTP_202_ACCEPTED)
             
-            for lead in leads:
-                try:
-                    # STEP 1: Calculate Rule-Based Score (0-50 points)
-                    # This uses objective criteria: role seniority, industry match, data completeness
-                    lead_dict = {
-                        'role': lead.role,
-                        'industry': lead.industry,
-                        'name': lead.name,
-                        'company': lead.company,
-                        'location': lead.location,
-                        'linkedin_bio': lead.linkedin_bio
-                    }
-                    offer_dict = {
-                        'ideal_use_cases': offer.ideal_use_cases,
-                        'value_props': offer.value_props
-                    }
-                    
-                    rule_score, rule_reasons = calculate_rule_score(lead_dict, offer_dict)
-                    
-                    # STEP 2: Calculate AI Score (0-50 points)
-                    # This uses OpenAI to classify intent: High=50, Medium=30, Low=10
-                    if settings.OPENAI_API_KEY:
-                        ai_score, ai_intent, ai_reasoning = self._get_ai_intent_score(lead, offer)
-                    else:
-                        # If no API key, default to low AI score
-                        ai_score, ai_intent, ai_reasoning = 10, "Low", "No AI API key configured"
-                    
-                    # STEP 3: Combine scores (HYBRID APPROACH)
-                    # Final Score = Rule Score + AI Score (max 100)
-                    final_score = min(rule_score + ai_score, 100)
-                    
-                    # Classify final intent based on combined score
-                    if final_score >= 70:
-                        final_intent = "High"
-                    elif final_score >= 40:
-                        final_intent = "Medium"
-                    else:
-                        final_intent = "Low"
-                    
-                    # Combine reasoning from both layers
-                    combined_reasoning = f"[Rule: {', '.join(rule_reasons)}] [AI: {ai_reasoning}]"
-                    
-                    # Save results to database
-                    lead.score = final_score
-                    lead.intent = final_intent
-                    lead.reasoning = combined_reasoning
-                    lead.save()
-                    
-                    results.append({
-                        'name': lead.name,
-                        'role': lead.role,
-                        'company': lead.company,
-                        'intent': final_intent,
-                        'score': final_score,
-                        'reasoning': combined_reasoning,
-                        'score_breakdown': {
-                            'rule_score': rule_score,
-                            'ai_score': ai_score
-                        }
-                    })
-                    
-                except RateLimitError:
-                    # Fallback: Use only rule-based score if AI rate limited
-                    final_score = min(rule_score * 2, 100)  # Scale up rule score to 0-100 range
-                    final_intent = "High" if final_score >= 70 else "Medium" if final_score >= 40 else "Low"
-                    fallback_reasoning = f"[Rule-based only - AI rate limited] {', '.join(rule_reasons)}"
-                    
-                    lead.score = final_score
-                    lead.intent = final_intent
-                    lead.reasoning = fallback_reasoning
-                    lead.save()
-                    
-                    results.append({
-                        'name': lead.name,
-                        'role': lead.role,
-                        'company': lead.company,
-                        'intent': final_intent,
-                        'score': final_score,
-                        'reasoning': fallback_reasoning
-                    })
-                
-                except Exception as lead_error:
-                    # Log individual lead errors but continue processing others
-                    print(f"Error scoring lead {lead.name}: {str(lead_error)}")
-                    continue
+            results = self._run_scoring(leads, offer)
             
             return Response({
                 'results': results,
@@ -316,28 +733,178 @@ class LeadViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=['post'])
+    def score_batch(self, request):
+        """
+        Submit all unscored leads to the OpenAI Batch API for offline scoring.
+        
+        Uses the same prompts as POST /api/leads/score/, at half the token cost
+        and outside the live rate limits, in exchange for latency of up to 24h.
+        Poll GET /api/leads/score_status/<job_id>/ to apply the results once
+        the batch completes. Submitted leads are claimed by the job, so later
+        scoring requests skip them until the batch reaches a final status.
+        
+        Returns:
+            202 with job_id, batch_id, status and total_leads
+        """
+        try:
+            offer = Offer.objects.first()
+            if not offer:
+                return Response(
+                    {'error': 'Please create an offer first using POST /api/offer/'}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not settings.OPENAI_API_KEY:
+                return Response(
+                    {'error': 'Batch scoring requires OPENAI_API_KEY; use POST /api/leads/score/ instead'}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # Claim the leads before submitting, so a second request made while
+            # this batch is pending cannot send the same prompts again
+            job, leads = self._start_job(offer, 'submitting')
+            
+            if job is None:
+                return Response(
+                    {'message': 'No unscored leads found. Upload leads using POST /api/leads/upload/'}, 
+                    status=status.HTTP_200_OK
+                )
+            
+            try:
+                batch = self._submit_batch(leads, offer)
+            except Exception:
+                # A final status releases the claimed leads for the next run
+                job.status = 'failed'
+                job.completed_at = timezone.now()
+                job.save(update_fields=['status', 'completed_at'])
+                raise
+            
+            job.batch_id = batch.id
+            job.status = batch.status
+            job.save(update_fields=['batch_id', 'status'])
+            
+            return Response({
+                'job_id': job.id,
+                'batch_id': job.batch_id,
+                'status': job.status,
+                'total_leads': job.total_leads
+            }, status=status.HTTP_202_ACCEPTED)
+            
+        except Exception as e:
+            return Response(
+                {"error": f"Batch submission failed: {str(e)}"}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _submit_batch(self, leads, offer):
+        """
+        Upload the classification requests for leads and start an OpenAI batch.
+        
+        Returns:
+            The OpenAI Batch object
+        """
+        # One request per AI_BATCH_SIZE leads; custom_id carries their ids
+        offer_block = _format_offer_block(offer)
+        lines = [json.dumps({
+            'custom_id': ','.join(str(lead.id) for lead in chunk),
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': self._build_ai_request(self._build_ai_messages(chunk, offer_block), len(chunk))
+        }) for chunk in _chunk_leads(leads)]
+        
+        client = get_openai_client()
+        batch_file = client.files.create(
+            file=('scoring_batch.jsonl', '\n'.join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        return client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+
+    @action(detail=False, methods=['get'], url_path=r'score_status/(?P<job_id>\d+)')
+    def score_status(self, request, job_id=None):
+        """
+        Check a scoring job started by score_batch or score?background=true.
+        
+        Batch API jobs are applied here once OpenAI completes them, with the
+        same hybrid formula as POST /api/leads/score/. Leads scored by another
+        run since submission keep their newer score. Background jobs update
+        themselves and are only reported; one with no heartbeat for
+        SCORING_JOB_TIMEOUT_MINUTES is reported as failed.
+        """
+        try:
+            job = ScoringJob.objects.select_related('offer').get(id=job_id)
+        except ScoringJob.DoesNotExist:
+            return Response({'error': 'Scoring job not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        try:
+            if (not job.batch_id and job.status not in BATCH_FINAL_STATUSES
+                    and job.updated_at < _stale_job_cutoff()):
+                # No heartbeat for too long: the worker running this job was
+                # restarted and its thread is gone. Conditional, so a thread
+                # that just finished keeps its own outcome.
+                ScoringJob.objects.filter(
+                    id=job.id, updated_at=job.updated_at
+                ).exclude(status__in=BATCH_FINAL_STATUSES).update(
+                    status='failed', completed_at=timezone.now()
+                )
+                job.refresh_from_db()
+            
+            if job.batch_id and job.status not in BATCH_FINAL_STATUSES:
+                client = get_openai_client()
+                batch = client.batches.retrieve(job.batch_id)
+                
+                if batch.status == 'completed':
+                    output = client.files.content(batch.output_file_id).text if batch.output_file_id else ''
+                    ai_by_lead = _parse_batch_output(output)
+                    leads = list(
+                        Lead.objects.filter(id__in=list(ai_by_lead), score__isnull=True)
+                        .only('id', *REQUIRED_FIELDS)
+                    )
+                    rule_flags = self._get_rule_flags(leads, job.offer)
+                    results = self._save_scores(leads, rule_flags, [ai_by_lead[lead.id] for lead in leads])
+                    job.total_scored = len(results)
+                
+                job.status = batch.status
+                if job.status in BATCH_FINAL_STATUSES:
+                    job.completed_at = timezone.now()
+                job.save(update_fields=['status', 'total_scored', 'completed_at'])
+            
+            return Response({
+                'job_id': job.id,
+                'batch_id': job.batch_id,
+                'status': job.status,
+                'total_leads': job.total_leads,
+                'total_scored': job.total_scored,
+                'completed_at': job.completed_at
+            })
+            
+        except Exception as e:
+            return Response(
+                {"error": f"Status check failed: {str(e)}"}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
     @action(detail=False, methods=['get'])
     def export_csv(self, request):
         """
         Export all scored leads to CSV file.
         Bonus feature: Allows downloading scored results for external analysis.
         """
-        leads = Lead.objects.filter(score__isnull=False).order_by('-score')
-        response = HttpResponse(content_type='text/csv')
+        # values_list + iterator() streams rows from the DB cursor in chunks,
+        # so memory stays flat and the first bytes go out immediately
+        rows = (
+            Lead.objects.filter(score__isnull=False)
+            .order_by('-score')
+            .values_list(*EXPORT_FIELDS)
+            .iterator(chunk_size=2000)
+        )
+        writer = csv.writer(Echo())
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in itertools.chain([EXPORT_HEADER], rows)),
+            content_type='text/csv'
+        )
         response['Content-Disposition'] = 'attachment; filename="leads_export.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Name', 'Role', 'Company', 'Industry', 'Location', 'Intent', 'Score', 'Reasoning'])
-        
-        for lead in leads:
-            writer.writerow([
-                lead.name,
-                lead.role, 
-                lead.company,
-                lead.industry,
-                lead.location,
-                lead.intent,
-                lead.score,
-                lead.reasoning
-            ])
-        return response
\ No newline at end of file
+        return response
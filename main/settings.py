@@ -82,13 +82,25 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # OpenAI Settings
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+# Maximum number of OpenAI requests in flight while scoring a batch
+OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', '10'))
+# Retries (exponential backoff with jitter) for rate limits, timeouts and connection errors
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '2'))
+# Client-side pacing; match these to the account's rate limits
+OPENAI_MAX_REQUESTS_PER_MINUTE = int(os.getenv('OPENAI_MAX_REQUESTS_PER_MINUTE', '3500'))
+OPENAI_MAX_TOKENS_PER_MINUTE = int(os.getenv('OPENAI_MAX_TOKENS_PER_MINUTE', '60000'))
+
+# Background scoring jobs with no heartbeat (one per finished AI request) for this
+# many minutes are assumed lost (e.g. the worker restarted) and marked failed,
+# releasing their leads
+SCORING_JOB_TIMEOUT_MINUTES = int(os.getenv('SCORING_JOB_TIMEOUT_MINUTES', '60'))
 
 # Rest Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'leads.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
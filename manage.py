@@ -1,9 +1,25 @@
 #!/usr/bin/env python
 """Django's command-line utility for administrative tasks."""
 import os
+import socket
 import sys
 
 
+def find_free_port(addr, start=8000, end=8100):
+    """Return the first port in [start, end) that can be bound on addr."""
+    for port in range(start, end):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # runserver sets SO_REUSEADDR, so a port still in TIME_WAIT from a
+            # server that just stopped is usable and must not be skipped
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((addr, port))
+            except OSError:
+                continue
+            return port
+    raise RuntimeError(f'No free port between {start} and {end - 1}')
+
+
 def main():
     """Run administrative tasks."""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
@@ -14,9 +30,12 @@ def main():
             "Couldn't import Django. Are you sure it's installed?"
         ) from exc
 
-    # Change default port if 8000 is in use
-    if len(sys.argv) > 1 and sys.argv[1] == 'runserver' and len(sys.argv) == 2:
-        sys.argv.append('8001')  # Use port 8001 instead
+    # Fall back to the next free port if 8000 is in use. The address is passed
+    # along with the port, so runserver binds the interface that was probed.
+    if len(sys.argv) == 2 and sys.argv[1] == 'runserver':
+        from django.core.management.commands.runserver import Command as RunserverCommand
+        addr = RunserverCommand.default_addr
+        sys.argv.append(f'{addr}:{find_free_port(addr)}')
 
     execute_from_command_line(sys.argv)
 
@@ -6,64 +6,128 @@ This script tests all major endpoints of the lead scoring API:
 2. POST /api/leads/upload/ - Upload CSV file with lead data
 3. POST /api/leads/score/ - Run hybrid scoring pipeline (rule-based + AI)
 4. GET /api/leads/results/ - Retrieve paginated scored results
+5. GET /api/leads/export_csv/ - Download scored results as CSV
 
 Usage:
     python test_api.py
+    LOG_LEVEL=DEBUG python test_api.py   # also print every response body
 
 Requirements:
-    - Backend server running on localhost:8001
-    - Python packages: requests
+    - Backend server running on localhost:8000 (set API_SERVER_URL to
+      target another address, e.g. when runserver fell back to another port)
+    - Python packages: requests, orjson
     - Valid OpenAI API key configured in .env (for AI scoring)
 
 Features:
     - Automatic server availability check
     - HTTP retry strategy for transient failures
-    - Detailed response logging
-    - Automatic test data cleanup
+    - Detailed response logging (LOG_LEVEL=DEBUG)
 
 Author: Lead Scoring Backend Team
 """
 
 import requests
-import json
+import csv
+import io
+import logging
+import math
 import os
-import time
+import orjson
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-BASE_URL = 'http://localhost:8001/api'  # Match Django's running port
+SERVER_URL = os.getenv('API_SERVER_URL', 'http://localhost:8000')  # Match Django's running port
+BASE_URL = f'{SERVER_URL}/api'
+
+# Endpoint URLs, built once
+OFFER_URL = f'{BASE_URL}/offer/'
+UPLOAD_URL = f'{BASE_URL}/leads/upload/'
+SCORE_URL = f'{BASE_URL}/leads/score/'
+RESULTS_URL = f'{BASE_URL}/leads/results/'
+EXPORT_URL = f'{BASE_URL}/leads/export_csv/'
+
+# Configure retry strategy for handling transient network errors.
+# Refused connections (server still starting) are retried for every method;
+# server errors only for idempotent GETs and HEADs.
+retry_strategy = Retry(
+    total=3,  # Maximum retry attempts
+    backoff_factor=1,  # Wait 0, 2, 4 seconds before successive retries (~6s in total)
+    status_forcelist=[500, 502, 503, 504],  # Retry on server errors
+    allowed_methods=["GET", "HEAD"]
+)
+# Concurrent requests in flight at once; the connection pool is sized to match
+MAX_WORKERS = max(4, os.cpu_count() or 1)
+# One keep-alive pool shared by every call in the run (single host)
+adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry_strategy)
+session = requests.Session()
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+
+logger = logging.getLogger(__name__)
+
+# Sample leads with varying roles and industries; repeat ROWS to scale the upload
+HEADER = ('name', 'role', 'company', 'industry', 'location', 'linkedin_bio')
+ROWS = (
+    ('John Doe', 'CEO', 'TechCorp', 'B2B SaaS', 'New York', 'Experienced CEO with 15 years in SaaS'),
+    ('Jane Smith', 'Head of Sales', 'DataFlow', 'B2B SaaS', 'San Francisco', '10+ years leading enterprise sales teams'),
+    ('Mike Wilson', 'Manager', 'CloudTech', 'Healthcare', 'London', 'Technology implementation specialist'),
+)
+
+# Set once check_server() has reached the server
+_server_ok = False
 
 def check_server():
     """
     Verify that the backend server is running and accessible.
-    Attempts connection up to 3 times with 2-second delays.
+    Sends a HEAD to the API root, so no body is downloaded; the router
+    always serves the root, so only a 2xx answer counts as this API being up.
+    Connection failures are retried by the session's retry strategy.
+    A successful probe is remembered for the rest of the run.
     
     Returns:
         bool: True if server is accessible, False otherwise
     """
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        try:
-            response = requests.get('http://localhost:8001/admin/')
-            if response.status_code == 200 or response.status_code == 404:
-                return True
-        except requests.exceptions.ConnectionError:
-            if attempt < max_attempts - 1:
-                print(f"Server not ready, waiting... (attempt {attempt + 1}/{max_attempts})")
-                time.sleep(2)
-            continue
-    return False
-
-# Configure retry strategy for handling transient network errors
-retry_strategy = Retry(
-    total=3,  # Maximum retry attempts
-    backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
-    status_forcelist=[500, 502, 503, 504]  # Retry on server errors
-)
-adapter = HTTPAdapter(max_retries=retry_strategy)
-session = requests.Session()
-session.mount("http://", adapter)
-session.mount("https://", adapter)
+    global _server_ok
+    if _server_ok:
+        return True
+    try:
+        # Fail fast on a refused connection, but give a cold runserver time
+        # to answer its first request
+        response = session.head(f'{BASE_URL}/', timeout=(0.5, 5), allow_redirects=False)
+    except requests.exceptions.RequestException:
+        return False
+    _server_ok = 200 <= response.status_code < 300
+    return _server_ok
+
+def _parsed(response):
+    """
+    Decode a JSON response body once and cache it on the response,
+    so logging and inspecting the same body share a single parse.
+    
+    Args:
+        response (requests.Response): Response with a JSON body
+    
+    Returns:
+        The decoded body
+    """
+    try:
+        return response._parsed_body
+    except AttributeError:
+        response._parsed_body = orjson.loads(response.content)
+        return response._parsed_body
+
+def log_response(response):
+    """
+    Pretty-print a JSON response body at DEBUG level.
+    The body is only re-encoded when DEBUG output is enabled.
+    
+    Args:
+        response (requests.Response): Response with a JSON body
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s", orjson.dumps(_parsed(response), option=orjson.OPT_INDENT_2).decode())
 
 def test_create_offer():
     """
@@ -82,28 +146,29 @@ def test_create_offer():
         "value_props": ["24/7 outreach", "6x more meetings"],
         "ideal_use_cases": ["B2B SaaS mid-market"]
     }
-    response = session.post(f'{BASE_URL}/offer/', json=offer_data)
+    response = session.post(OFFER_URL, json=offer_data)
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    log_response(response)
     return response.ok
 
-def create_test_csv():
+def create_test_csv(rows=ROWS):
     """
-    Generate a test CSV file with sample lead data.
+    Generate a test CSV with sample lead data, in memory.
     Creates leads with varying roles (CEO, Head of Sales, Manager) and industries.
+    csv.writer handles quoting, so rows may contain commas or quotes.
+    
+    Args:
+        rows (Iterable[tuple]): Lead rows in HEADER order
     
     Returns:
-        str: Filename of the created CSV file
+        io.BytesIO: CSV content ready to upload
     """
     print("\n2. Creating test CSV...")
-    csv_content = """name,role,company,industry,location,linkedin_bio
-John Doe,CEO,TechCorp,B2B SaaS,New York,Experienced CEO with 15 years in SaaS
-Jane Smith,Head of Sales,DataFlow,B2B SaaS,San Francisco,10+ years leading enterprise sales teams
-Mike Wilson,Manager,CloudTech,Healthcare,London,Technology implementation specialist"""
-    
-    with open('test_leads.csv', 'w') as f:
-        f.write(csv_content)
-    return 'test_leads.csv'
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    writer.writerows(rows)
+    return io.BytesIO(buffer.getvalue().encode('utf-8'))
 
 def test_upload_leads(csv_file):
     """
@@ -111,16 +176,18 @@ def test_upload_leads(csv_file):
     Uploads a CSV file containing lead information.
     
     Args:
-        csv_file (str): Path to the CSV file to upload
+        csv_file (io.BytesIO): CSV content to upload
     
     Returns:
         bool: True if upload succeeds, False otherwise
     """
     print("\n3. Testing Lead Upload...")
-    with open(csv_file, 'rb') as f:
-        response = session.post(f'{BASE_URL}/leads/upload/', files={'file': f})
+    response = session.post(
+        UPLOAD_URL,
+        files={'file': ('test_leads.csv', csv_file, 'text/csv')}
+    )
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    log_response(response)
     return response.ok
 
 def test_score_leads():
@@ -132,55 +199,96 @@ def test_score_leads():
         bool: True if scoring succeeds, False otherwise
     """
     print("\n4. Testing Lead Scoring...")
-    response = session.post(f'{BASE_URL}/leads/score/')
+    response = session.post(SCORE_URL)
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    log_response(response)
     return response.ok
 
 def test_get_results():
     """
     Test GET /api/leads/results/ endpoint.
     Retrieves paginated results of scored leads with intent classification.
+    The first page gives the total count; remaining pages are fetched in parallel.
     
     Returns:
         bool: True if results retrieval succeeds, False otherwise
     """
     print("\n5. Testing Results Retrieval...")
-    response = session.get(f'{BASE_URL}/leads/results/')
+    response = session.get(RESULTS_URL)
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    return response.ok
+    log_response(response)
+    if not response.ok:
+        return False
+    
+    first_page = _parsed(response)
+    page_size = len(first_page['results'])
+    pages = math.ceil(first_page['count'] / page_size) if page_size else 1
+    
+    # Pages are independent reads, so they share the session's pool concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(session.get, RESULTS_URL, params={'page': page}): page
+            for page in range(2, pages + 1)
+        }
+        for future in as_completed(futures):
+            page_response = future.result()
+            print(f"Page {futures[future]} status: {page_response.status_code}")
+            if not page_response.ok:
+                return False
+    return True
+
+def test_export_csv():
+    """
+    Test GET /api/leads/export_csv/ endpoint.
+    Streams the CSV export to a temporary file in 64 KiB chunks, so memory use
+    does not grow with the number of scored leads. The file is deleted afterwards.
+    
+    Returns:
+        bool: True if the export downloads successfully, False otherwise
+    """
+    print("\n6. Testing CSV Export...")
+    with session.get(EXPORT_URL, stream=True) as response:
+        print(f"Status: {response.status_code}")
+        if not response.ok:
+            return False
+        with tempfile.TemporaryFile() as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+            print(f"Downloaded export ({f.tell()} bytes)")
+    return True
 
 def main():
     """
     Main test execution flow.
     Runs all API tests sequentially and reports success/failure.
-    Automatically cleans up test data on completion.
     """
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
     print("Starting API Tests...")
     
-    # Run tests in sequence
-    if not test_create_offer():
-        print("Offer creation failed!")
-        return
-    
-    csv_file = create_test_csv()
-    if not test_upload_leads(csv_file):
-        print("Lead upload failed!")
-        return
-    
-    if not test_score_leads():
-        print("Lead scoring failed!")
-        return
-    
-    if not test_get_results():
-        print("Results retrieval failed!")
-        return
+    # Run tests in sequence; the session's connection pool is closed on exit
+    with session:
+        if not test_create_offer():
+            print("Offer creation failed!")
+            return
+        
+        csv_file = create_test_csv()
+        if not test_upload_leads(csv_file):
+            print("Lead upload failed!")
+            return
+        
+        if not test_score_leads():
+            print("Lead scoring failed!")
+            return
+        
+        if not test_get_results():
+            print("Results retrieval failed!")
+            return
+        
+        if not test_export_csv():
+            print("CSV export failed!")
+            return
     
     print("\n All tests completed successfully!")
-    
-    # Cleanup test artifacts
-    os.remove(csv_file)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file